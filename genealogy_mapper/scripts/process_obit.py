@@ -4,7 +4,6 @@ from genealogy_mapper.core.ner_processor import ObituaryNERProcessor
 import json
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def fetch_obituary(url):
@@ -17,7 +16,7 @@ def fetch_obituary(url):
         response.raise_for_status()
         return response.text
     except Exception as e:
-        logger.error(f"Failed to fetch obituary: {e}")
+        logger.error("Failed to fetch obituary: %s", e)
         return None
 
 def extract_obituary_text(html_content):
@@ -90,4 +89,5 @@ def main():
     print(obit_text)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main() 
\ No newline at end of file
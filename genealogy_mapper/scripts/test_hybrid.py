@@ -6,8 +6,6 @@ import json
 import logging
 from genealogy_mapper.core.hybrid_processor import HybridProcessor
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def main():
@@ -47,4 +45,6 @@ def main():
     return 0
 
 if __name__ == "__main__":
+    # Set up logging
+    logging.basicConfig(level=logging.INFO)
     exit(main()) 
\ No newline at end of file
@@ -29,6 +29,7 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.5.0",
             "pre-commit>=3.0.0"
         ]
     },
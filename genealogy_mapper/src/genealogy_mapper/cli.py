@@ -11,7 +11,7 @@ import json
 from pathlib import Path
 from .core.ner_processor import ObituaryNERProcessor
 from .core.hybrid_processor import HybridProcessor
-from .core.neo4j_ops import Neo4jOperations, Conflict, ConflictResolution
+from .core.neo4j_ops import Neo4jOperations, Conflict, ConflictResolution, GENDER_CODES
 import os
 from datetime import datetime
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
@@ -60,13 +60,8 @@ def format_for_neo4j(person_info: Dict[str, Any]) -> Dict[str, Any]:
     # Normalize gender
     if person_info.get('gender'):
         gender = person_info['gender'].lower()
-        valid_genders = {
-            'm': 'M', 'male': 'M',
-            'f': 'F', 'female': 'F',
-            'u': 'U', 'unknown': 'U'
-        }
-        if gender in valid_genders:
-            person_info['gender'] = valid_genders[gender]
+        if gender in GENDER_CODES:
+            person_info['gender'] = GENDER_CODES[gender]
     
     # Add metadata about data quality
     person_info['data_quality'] = {
@@ -218,18 +213,15 @@ def check_dependencies() -> Tuple[bool, List[str]]:
         except ImportError:
             missing_packages.append(package)
     
-    # Check if Playwright browsers are installed
+    # Check if Playwright browsers are installed. Looking for each browser's
+    # executable is enough; launching them is slow and leaves them running.
     if 'playwright' not in missing_packages:
         try:
             from playwright.sync_api import sync_playwright
             with sync_playwright() as p:
                 browsers = p.chromium, p.firefox, p.webkit
-                for browser in browsers:
-                    try:
-                        browser.launch()
-                    except Exception:
-                        missing_packages.append('playwright-browsers')
-                        break
+                if not all(os.path.exists(browser.executable_path) for browser in browsers):
+                    missing_packages.append('playwright-browsers')
         except Exception:
             missing_packages.append('playwright-browsers')
     
@@ -329,7 +321,7 @@ def extract_obit_text(
         # Load and validate JSON file
         try:
             logger.debug(f"Loading JSON file: {file_path}")
-            with open(file_path, 'r') as f:
+            with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             logger.info(f"Successfully loaded JSON file with {len(data.get('urls', []))} URLs")
         except json.JSONDecodeError as e:
@@ -504,16 +496,24 @@ def add_obit_people(input_file: str, output_file: Optional[str] = None, use_hybr
             processor = ObituaryNERProcessor()
         
         # Read input file
-        with open(input_file, 'r') as f:
+        with open(input_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
             
-        # Process each obituary
-        results = []
+        # Collect the obituaries that have text to process
+        items = []
         for item in data.get('urls', []):
             if not item.get('extracted_text'):
                 logger.warning(f"No text found for URL: {item.get('url')}")
                 continue
-                
+            items.append(item)
+
+        # The NER processor parses all texts in one spaCy batch
+        if not use_hybrid:
+            ner_infos = processor.extract_person_info_batch([item['extracted_text'] for item in items])
+
+        # Process each obituary
+        results = []
+        for index, item in enumerate(items):
             # Extract person information
             if use_hybrid:
                 person_info = processor.extract_info(item['extracted_text'])
@@ -530,7 +530,7 @@ def add_obit_people(input_file: str, output_file: Optional[str] = None, use_hybr
                     'source': person_info.source
                 }
             else:
-                person_info = processor.extract_person_info(item['extracted_text'])
+                person_info = ner_infos[index]
                 person_dict = {
                     'full_name': person_info.full_name,
                     'birth_date': person_info.birth_date,
@@ -558,8 +558,8 @@ def add_obit_people(input_file: str, output_file: Optional[str] = None, use_hybr
             
         # Write results to output file
         output_file = output_file or 'obituary_people.json'
-        with open(output_file, 'w') as f:
-            json.dump({'results': results}, f, indent=2)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump({'results': results}, f, indent=2, ensure_ascii=False)
             
         logger.info(f"Processed {len(results)} obituaries. Results written to {output_file}")
         
@@ -589,7 +589,7 @@ def import_to_neo4j(input_file: str, config_path: Optional[str] = None, dry_run:
         )
         
         # Read input file
-        with open(input_file, 'r') as f:
+        with open(input_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
             
         # Import data
@@ -672,7 +672,7 @@ def extract_relationships(input_file: str, output_file: Optional[str] = None, fo
         
         # Read input file
         try:
-            with open(input_file, 'r') as f:
+            with open(input_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
         except FileNotFoundError:
             logger.error(f"Input file not found: {input_file}")
@@ -686,8 +686,8 @@ def extract_relationships(input_file: str, output_file: Optional[str] = None, fo
         # Create backup of input file
         backup_file = f"{input_file}.bak"
         try:
-            with open(backup_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(backup_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
             logger.info(f"Created backup of input file at: {backup_file}")
         except Exception as e:
             logger.warning(f"Failed to create backup file: {e}")
@@ -754,7 +754,7 @@ Please provide a detailed analysis of all people and their relationships."""
         
         # Write results to output file
         output_file = output_file or 'obituary_relationships.json'
-        with open(output_file, 'w') as f:
+        with open(output_file, 'w', encoding='utf-8') as f:
             json.dump({
                 'results': [{
                     'url': item['url'],
@@ -762,7 +762,7 @@ Please provide a detailed analysis of all people and their relationships."""
                     'status': item['relationships_extracted'].get('status'),
                     'last_attempt': item['relationships_extracted'].get('last_attempt')
                 } for item in results]
-            }, f, indent=2)
+            }, f, indent=2, ensure_ascii=False)
             
         logger.info(f"Processed {len(results)} obituaries")
         click.echo(f"Successfully processed {len(results)} obituaries")
@@ -787,7 +787,7 @@ def import_relationships(input_file: str, dry_run: bool = False):
         processor = RelationshipProcessor(neo4j_config)
         
         # Read input file
-        with open(input_file, 'r') as f:
+        with open(input_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
         if dry_run:
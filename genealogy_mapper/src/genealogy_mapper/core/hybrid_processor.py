@@ -2,6 +2,7 @@
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
@@ -43,6 +44,9 @@ class HybridProcessor:
         self.openai_client = openai.OpenAI(api_key=openai_api_key)
         self.model = model
         self.regex_processor = ObituaryNERProcessor()
+        # One background worker, reused by every extract_info call, runs the
+        # OpenAI request while the regex extraction runs in the caller
+        self._openai_executor = ThreadPoolExecutor(max_workers=1)
         
     def _create_extraction_prompt(self, text: str) -> str:
         """Create the prompt for OpenAI extraction."""
@@ -113,7 +117,7 @@ Obituary text:
         is_birth_year_calculated = False
         if person_info.death_date and person_info.age:
             try:
-                death_year = int(person_info.death_date.split()[-1])
+                death_year = int(person_info.death_date.rsplit(None, 1)[-1])
                 birth_year = death_year - person_info.age
                 is_birth_year_calculated = True
             except (ValueError, IndexError):
@@ -169,11 +173,11 @@ Obituary text:
         Returns:
             ExtractionResult containing the extracted information
         """
-        # Try OpenAI first
-        openai_result = self._extract_with_openai(text)
-        
-        # Always get regex result as fallback
+        # Run the OpenAI request in the background while the regex
+        # extraction (always needed as a fallback) runs locally
+        openai_future = self._openai_executor.submit(self._extract_with_openai, text)
         regex_result = self._extract_with_regex(text)
+        openai_result = openai_future.result()
         
         # Merge results
         return self._merge_results(openai_result, regex_result) 
\ No newline at end of file
@@ -8,6 +8,13 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Accepted gender spellings (lowercase) mapped to their single-letter code
+GENDER_CODES = {
+    'm': 'M', 'male': 'M',
+    'f': 'F', 'female': 'F',
+    'u': 'U', 'unknown': 'U'
+}
+
 class ValidationError(Exception):
     """Raised when data validation fails."""
     pass
@@ -85,16 +92,11 @@ class Neo4jOperations:
         # Gender validation
         if person_info.get('gender'):
             gender = person_info['gender'].lower()
-            valid_genders = {
-                'm': 'M', 'male': 'M',
-                'f': 'F', 'female': 'F',
-                'u': 'U', 'unknown': 'U'
-            }
-            if gender not in valid_genders:
+            if gender not in GENDER_CODES:
                 errors.append(f"Invalid gender: {person_info['gender']}")
             else:
                 # Normalize gender to single letter
-                person_info['gender'] = valid_genders[gender]
+                person_info['gender'] = GENDER_CODES[gender]
             
         # Data quality warnings
         if person_info.get('data_quality', {}).get('birth_year_calculated'):
@@ -369,11 +371,21 @@ class Neo4jOperations:
         Returns:
             Tuple[bool, str]: (success, message)
         """
+        success, message, _ = self._import_person(person_info, url)
+        return success, message
+    
+    def _import_person(self, person_info: Dict[str, Any], url: str) -> Tuple[bool, str, Optional[OperationType]]:
+        """Import a person and report which operation was performed.
+        
+        Returns:
+            Tuple[bool, str, Optional[OperationType]]: (success, message, operation),
+            where operation is CREATE or UPDATE on success and None otherwise
+        """
         try:
             # Validate person info
             validation = self._validate_person_info(person_info)
             if not validation.is_valid:
-                return False, f"Validation failed: {', '.join(validation.errors)}"
+                return False, f"Validation failed: {', '.join(validation.errors)}", None
             
             with self.driver.session() as session:
                 # Check for existing person
@@ -383,7 +395,7 @@ class Neo4jOperations:
                     # Validate update and get conflicts
                     update_validation, conflicts = self._validate_update(existing_id, person_info)
                     if not update_validation.is_valid:
-                        return False, f"Update validation failed: {', '.join(update_validation.errors)}"
+                        return False, f"Update validation failed: {', '.join(update_validation.errors)}", None
                         
                     # Resolve conflicts
                     resolved_conflicts = self._resolve_conflicts(conflicts)
@@ -402,12 +414,14 @@ class Neo4jOperations:
                     # Update existing person
                     session.execute_write(lambda tx: self._update_individual(tx, existing_id, resolved_info))
                     indi_id = existing_id
+                    operation = OperationType.UPDATE
                     message = f"Updated existing person {person_info['full_name']}"
                     if update_validation.warnings:
                         message += f" (Warnings: {', '.join(update_validation.warnings)})"
                 else:
                     # Create new person
                     indi_id = session.execute_write(lambda tx: self._create_individual(tx, person_info))
+                    operation = OperationType.CREATE
                     message = f"Created new person {person_info['full_name']}"
                     if validation.warnings:
                         message += f" (Warnings: {', '.join(validation.warnings)})"
@@ -422,12 +436,12 @@ class Neo4jOperations:
                 ))
                 
                 logger.info(message)
-                return True, message
+                return True, message, operation
                 
         except Exception as e:
             error_msg = f"Error importing person {person_info.get('full_name')}: {e}"
             logger.error(error_msg)
-            return False, error_msg
+            return False, error_msg, None
             
     def import_batch(self, results: List[Dict[str, Any]], dry_run: bool = False) -> Dict[str, Any]:
         """Import a batch of processed obituaries.
@@ -482,10 +496,10 @@ class Neo4jOperations:
         
         for result in results:
             if result['status'] == 'success':
-                success, message = self.import_person(result['person_info'], result['url'])
+                success, message, operation = self._import_person(result['person_info'], result['url'])
                 if success:
                     stats['success'] += 1
-                    if 'Updated' in message:
+                    if operation == OperationType.UPDATE:
                         stats['updated'] += 1
                     else:
                         stats['created'] += 1
@@ -14,10 +14,148 @@ from .patterns import (
     ADDRESS_PATTERNS,
     SERVICE_PATTERNS,
     ADDRESS_DATE_PATTERNS,
+    EDUCATION_TERMS,
+    MILITARY_TERMS,
 )
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r'\s+')
+
+def _combine_patterns(patterns: List[str], flags: int = 0) -> Tuple[re.Pattern, Dict[str, Tuple[int, int, int]]]:
+    """Combine prioritized patterns into one alternation that is scanned once.
+    
+    Args:
+        patterns: Regex patterns in priority order.
+        flags: Flags applied to the combined pattern.
+        
+    Returns:
+        The compiled alternation and, per named alternative, its priority,
+        the number of its first capturing group and its group count.
+    """
+    alternatives = []
+    layout = {}
+    group_number = 1
+    for index, pattern in enumerate(patterns):
+        name = f"p{index}"
+        group_count = re.compile(pattern, flags).groups
+        alternatives.append(f"(?P<{name}>{pattern})")
+        layout[name] = (index, group_number + 1, group_count)
+        group_number += group_count + 1
+    return re.compile('|'.join(alternatives), flags), layout
+
+def _first_matches(regex: re.Pattern, layout: Dict[str, Tuple[int, int, int]], text: str) -> List[Tuple[Optional[str], ...]]:
+    """Return the groups of each alternative's first match, in priority order.
+    
+    Equivalent to running re.search once per pattern in priority order, but
+    the text is only scanned once.
+    """
+    first = {}
+    for match in regex.finditer(text):
+        index, first_group, group_count = layout[match.lastgroup]
+        if index not in first:
+            first[index] = match.groups()[first_group - 1:first_group - 1 + group_count]
+    return [first[index] for index in sorted(first)]
+
+def _all_matches(regex: re.Pattern, layout: Dict[str, Tuple[int, int, int]], text: str) -> List[List[Tuple[Optional[str], ...]]]:
+    """Return the groups of every match of each alternative, in priority order.
+    
+    Equivalent to running re.finditer once per pattern in priority order, for
+    patterns whose matches cannot overlap each other, but the text is only
+    scanned once.
+    """
+    matches = [[] for _ in layout]
+    for match in regex.finditer(text):
+        index, first_group, group_count = layout[match.lastgroup]
+        matches[index].append(match.groups()[first_group - 1:first_group - 1 + group_count])
+    return matches
+
+def _assemble_name(groups: Tuple[str, ...], last_name_first: bool) -> Tuple[str, Optional[str]]:
+    """Build the full and maiden name from the groups of a NAME_PATTERNS match.
+    
+    Args:
+        groups: The two name parts, followed by the maiden name for the (NEE) patterns.
+        last_name_first: Whether the pattern is of the "LastName, FirstName" form.
+        
+    Returns:
+        Tuple of the "FirstName LastName" full name and the maiden name, if any.
+    """
+    if last_name_first:
+        last_name, first_name = groups[0], groups[1]
+    else:
+        first_name, last_name = groups[0], groups[1]
+    maiden_name = groups[2] if len(groups) == 3 else None
+    return f"{first_name.strip()} {last_name}", maiden_name
+
+def _any_of(patterns: List[str], flags: int = 0) -> re.Pattern:
+    """Compile patterns into one alternation that matches wherever any of them does."""
+    return re.compile('|'.join(f"(?:{pattern})" for pattern in patterns), flags)
+
+_AGE_RE, _AGE_LAYOUT = _combine_patterns(AGE_PATTERNS, re.IGNORECASE)
+_DEATH_DATE_RE, _DEATH_DATE_LAYOUT = _combine_patterns([pattern for pattern, _, _ in DEATH_DATE_PATTERNS])
+_DATE_RANGE_RE, _DATE_RANGE_LAYOUT = _combine_patterns([pattern for pattern, _, _ in DATE_RANGE_PATTERNS])
+
+# Compiled once at import instead of going through re's cache on every call.
+# Each name pattern also records whether it needs a literal "(NEE" in the
+# text (without it the maiden-name patterns backtrack through every run of
+# words before failing, so they are skipped up front) and whether it is of
+# the "LastName, FirstName" form.
+_NAME_RES = [
+    (re.compile(pattern), r'\(NEE' in pattern, pattern.startswith(r'([A-Za-z]+),'))
+    for pattern in NAME_PATTERNS
+]
+_GENDER_RES = {
+    gender_type: _any_of(patterns, re.IGNORECASE)
+    for gender_type, patterns in GENDER_PATTERNS.items()
+}
+_BORN_RES = [
+    re.compile(r'born\s+on\s+([A-Za-z]+\s+\d{1,2},\s+\d{4})'),
+    re.compile(r'born\s+on\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})'),
+    re.compile(r'born\s+in\s+(\d{4})'),
+    re.compile(r'born\s+([A-Za-z]+\s+\d{1,2},\s+\d{4})'),
+    re.compile(r'born\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})'),
+]
+_ADDRESS_RES = [re.compile(pattern, re.IGNORECASE) for pattern in ADDRESS_PATTERNS]
+_SERVICE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in SERVICE_PATTERNS]
+_ADDRESS_DATE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in ADDRESS_DATE_PATTERNS]
+_YEAR_RE = re.compile(r'^\d{4}$')
+
+# Exact shapes of the common date formats, dispatched to strptime before
+# falling back to the much slower fuzzy dateutil parse
+_DATE_FORMATS_RE = re.compile(
+    r'(?P<iso>\d{4}-\d{2}-\d{2})'
+    r'|(?P<slash>\d{1,2}/\d{1,2}/\d{4})'
+    r'|(?P<dash>\d{1,2}-\d{1,2}-\d{4})'
+    r'|(?P<month_day_year>[A-Za-z]+ \d{1,2}, \d{4})'
+    r'|(?P<day_month_year>\d{1,2} [A-Za-z]+ \d{4})'
+)
+_DATE_FORMATS = {
+    'iso': ("%Y-%m-%d",),
+    'slash': ("%m/%d/%Y",),
+    'dash': ("%m-%d-%Y",),
+    'month_day_year': ("%B %d, %Y", "%b %d, %Y"),
+    'day_month_year': ("%d %b %Y", "%d %B %Y"),
+}
+
+def _parse_known_format(date_str: str) -> Optional[datetime]:
+    """Parse a date string with strptime if it has one of the common exact formats.
+    
+    Returns None when the string has no known shape or strptime rejects it,
+    leaving the decision to dateutil.
+    """
+    match = _DATE_FORMATS_RE.fullmatch(date_str)
+    if match:
+        for date_format in _DATE_FORMATS[match.lastgroup]:
+            try:
+                return datetime.strptime(date_str, date_format)
+            except ValueError:
+                continue
+    return None
+
+# Sentence keywords are literals, so each list becomes one substring search
+_EDUCATION_TERMS_RE = re.compile('|'.join(map(re.escape, EDUCATION_TERMS)))
+_MILITARY_TERMS_RE = re.compile('|'.join(map(re.escape, MILITARY_TERMS)))
+
 @dataclass
 class PersonInfo:
     """Data class to store extracted person information."""
@@ -35,6 +173,10 @@ class PersonInfo:
     organizations: Optional[List[str]] = None
     raw_text: Optional[str] = None
 
+# Loaded spaCy pipelines keyed by model name; loading a model is the largest
+# fixed cost of creating a processor, and pipelines are not modified after load
+_NLP_CACHE: Dict[str, Any] = {}
+
 class BaseNERProcessor:
     """Base class for NER processing."""
     
@@ -44,12 +186,14 @@ class BaseNERProcessor:
         Args:
             model_name: Name of the spaCy model to use.
         """
-        try:
-            self.nlp = spacy.load(model_name)
-        except OSError:
-            logger.warning(f"Model {model_name} not found. Downloading...")
-            spacy.cli.download(model_name)
-            self.nlp = spacy.load(model_name)
+        if model_name not in _NLP_CACHE:
+            try:
+                _NLP_CACHE[model_name] = spacy.load(model_name)
+            except OSError:
+                logger.warning(f"Model {model_name} not found. Downloading...")
+                spacy.cli.download(model_name)
+                _NLP_CACHE[model_name] = spacy.load(model_name)
+        self.nlp = _NLP_CACHE[model_name]
 
 class ObituaryNERProcessor(BaseNERProcessor):
     """NER processor specifically for obituaries."""
@@ -61,6 +205,9 @@ class ObituaryNERProcessor(BaseNERProcessor):
             model_name: Name of the spaCy model to use. Defaults to "en_core_web_sm".
         """
         super().__init__(model_name)
+        # Formatted results keyed by raw date string; the same strings recur
+        # across the pattern, date-range and NER passes over one obituary
+        self._date_cache: Dict[str, Optional[str]] = {}
         
     def _format_date(self, date_str: str) -> Optional[str]:
         """Format a date string to the standard format '01 Jun 2025'.
@@ -71,23 +218,36 @@ class ObituaryNERProcessor(BaseNERProcessor):
         Returns:
             Formatted date string or None if parsing fails.
         """
+        if date_str in self._date_cache:
+            return self._date_cache[date_str]
+        
         try:
-            # Try to parse the date
-            parsed_date = parser.parse(date_str, fuzzy=True)
+            # Try the common exact formats first, then fuzzy parsing
+            parsed_date = _parse_known_format(date_str)
+            if parsed_date is None:
+                parsed_date = parser.parse(date_str, fuzzy=True)
             # Format as "01 Jun 2025"
-            return parsed_date.strftime("%d %b %Y")
+            formatted = parsed_date.strftime("%d %b %Y")
         except (ValueError, TypeError) as e:
             logger.debug(f"Failed to parse date '{date_str}': {e}")
-            return None
+            formatted = None
+        
+        self._date_cache[date_str] = formatted
+        return formatted
 
-    def _extract_name_and_gender(self, text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-        """Extract full name, maiden name, and gender from text."""
+    def _extract_name_and_gender(self, text: str, doc=None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Extract full name, maiden name, and gender from text.
+
+        Pass ``doc`` when the text has already been parsed to avoid running
+        the spaCy pipeline over it a second time.
+        """
         full_name = None
         maiden_name = None
         gender = None
         
         # First try to find a name using spaCy's NER
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
         for ent in doc.ents:
             if ent.label_ == "PERSON":
                 full_name = ent.text.strip()
@@ -95,57 +255,41 @@ class ObituaryNERProcessor(BaseNERProcessor):
         
         # If NER didn't find a name, try regex patterns
         if not full_name:
-            for pattern in NAME_PATTERNS:
-                match = re.search(pattern, text)
+            has_nee = '(NEE' in text
+            for name_re, needs_nee, last_name_first in _NAME_RES:
+                if needs_nee and not has_nee:
+                    continue
+                match = name_re.search(text)
                 if match:
-                    if len(match.groups()) == 3:  # First two patterns (with maiden name)
-                        if pattern.startswith(r'([A-Za-z]+),'):  # First pattern
-                            last_name, first_name, maiden = match.groups()
-                            full_name = f"{first_name.strip()} {last_name}"
-                        else:  # Second pattern
-                            first_name, last_name, maiden = match.groups()
-                            full_name = f"{first_name.strip()} {last_name}"
-                        maiden_name = maiden
-                    else:  # Last two patterns (without maiden name)
-                        if pattern.startswith(r'([A-Za-z]+),'):  # Third pattern
-                            last_name, first_name = match.groups()
-                            full_name = f"{first_name.strip()} {last_name}"
-                        else:  # Fourth pattern
-                            first_name, last_name = match.groups()
-                            full_name = f"{first_name.strip()} {last_name}"
+                    full_name, maiden_name = _assemble_name(match.groups(), last_name_first)
                     break
         
         # If still no name found, try to extract from the first sentence
         if not full_name:
-            first_sentence = text.split('.')[0].strip()
+            first_sentence = text.partition('.')[0].strip()
             words = first_sentence.split()
             if len(words) >= 2:
                 # Try to find a name-like pattern (two capitalized words)
-                for i in range(len(words) - 1):
-                    if words[i][0].isupper() and words[i+1][0].isupper():
-                        full_name = f"{words[i]} {words[i+1]}"
+                for first, second in zip(words, words[1:]):
+                    if first[0].isupper() and second[0].isupper():
+                        full_name = f"{first} {second}"
                         break
         
         # Determine gender based on patterns
-        for gender_type, patterns in GENDER_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    gender = gender_type
-                    break
-            if gender:
+        for gender_type, gender_re in _GENDER_RES.items():
+            if gender_re.search(text):
+                gender = gender_type
                 break
         
         return full_name, maiden_name, gender
 
     def _extract_age(self, text: str) -> Optional[int]:
         """Extract age from text."""
-        for pattern in AGE_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    return int(match.group(1))
-                except (ValueError, IndexError):
-                    continue
+        for groups in _first_matches(_AGE_RE, _AGE_LAYOUT, text):
+            try:
+                return int(groups[0])
+            except (ValueError, IndexError):
+                continue
         return None
 
     def _extract_dates(self, doc) -> Tuple[Optional[str], Optional[str]]:
@@ -155,42 +299,37 @@ class ObituaryNERProcessor(BaseNERProcessor):
         text = doc.text
         
         # First try to match date range patterns
-        for pattern, num_dates, _ in DATE_RANGE_PATTERNS:
-            matches = re.finditer(pattern, text)
-            for match in matches:
+        # Every range pattern is a single parenthesized group, so their matches
+        # never overlap and one combined scan finds the same matches. The
+        # patterns are case-sensitive, so a missing trigger rules them out.
+        range_matches = _all_matches(_DATE_RANGE_RE, _DATE_RANGE_LAYOUT, text) if '(' in text else []
+        for (_, num_dates, _), matches in zip(DATE_RANGE_PATTERNS, range_matches):
+            for groups in matches:
                 if num_dates == 2:
-                    birth_date = self._format_date(match.group(1))
-                    death_date = self._format_date(match.group(2))
+                    birth_date = self._format_date(groups[0])
+                    death_date = self._format_date(groups[1])
                     if birth_date and death_date:
                         return birth_date, death_date
                 elif num_dates == 1:
-                    date = self._format_date(match.group(1))
+                    date = self._format_date(groups[0])
                     if date:
                         # If we only have one date, assume it's the death date
                         death_date = date
         
         # If no date range found, try to find birth and death dates separately
         # Look for "born on" or "born in" patterns
-        born_patterns = [
-            r'born\s+on\s+([A-Za-z]+\s+\d{1,2},\s+\d{4})',
-            r'born\s+on\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})',
-            r'born\s+in\s+(\d{4})',
-            r'born\s+([A-Za-z]+\s+\d{1,2},\s+\d{4})',
-            r'born\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})'
-        ]
-        
-        for pattern in born_patterns:
-            match = re.search(pattern, text)
-            if match:
-                birth_date = self._format_date(match.group(1))
-                if birth_date:
-                    break
+        if 'born' in text:
+            for born_re in _BORN_RES:
+                match = born_re.search(text)
+                if match:
+                    birth_date = self._format_date(match.group(1))
+                    if birth_date:
+                        break
         
         # Look for death date patterns
-        for pattern, _, _ in DEATH_DATE_PATTERNS:
-            match = re.search(pattern, text)
-            if match:
-                death_date = self._format_date(match.group(1))
+        if 'died' in text or 'passed' in text:
+            for groups in _first_matches(_DEATH_DATE_RE, _DEATH_DATE_LAYOUT, text):
+                death_date = self._format_date(groups[0])
                 if death_date:
                     break
         
@@ -204,12 +343,13 @@ class ObituaryNERProcessor(BaseNERProcessor):
                         dates.append(date)
             
             if dates:
-                # Sort dates chronologically
-                dates.sort(key=lambda x: parser.parse(x, fuzzy=True))
-                if not birth_date and len(dates) > 0:
-                    birth_date = dates[0]
-                if not death_date and len(dates) > 1:
-                    death_date = dates[-1]
+                # Only the earliest and latest dates are needed, so parse each
+                # once and select them without sorting
+                parsed_dates = [(parser.parse(date, fuzzy=True), date) for date in dates]
+                if not birth_date:
+                    birth_date = min(parsed_dates)[1]
+                if not death_date and len(parsed_dates) > 1:
+                    death_date = max(parsed_dates)[1]
         
         return birth_date, death_date
     
@@ -220,14 +360,14 @@ class ObituaryNERProcessor(BaseNERProcessor):
         context_end = min(len(full_text), date_position + len(date_text) + 50)
         context = full_text[context_start:context_end]
         
-        for pattern in ADDRESS_PATTERNS:
-            if re.search(pattern, context, re.IGNORECASE):
+        for address_re in _ADDRESS_RES:
+            if address_re.search(context):
                 return True
         
         # Check if the date is a 4-digit year that's part of an address
-        if re.match(r'^\d{4}$', date_text):
-            for pattern in ADDRESS_DATE_PATTERNS:
-                if re.search(pattern, context, re.IGNORECASE):
+        if _YEAR_RE.match(date_text):
+            for address_date_re in _ADDRESS_DATE_RES:
+                if address_date_re.search(context):
                     return True
         
         return False
@@ -239,8 +379,8 @@ class ObituaryNERProcessor(BaseNERProcessor):
         context_end = min(len(full_text), date_position + len(date_text) + 50)
         context = full_text[context_start:context_end]
         
-        for pattern in SERVICE_PATTERNS:
-            if re.search(pattern, context, re.IGNORECASE):
+        for service_re in _SERVICE_RES:
+            if service_re.search(context):
                 return True
         
         return False
@@ -260,20 +400,32 @@ class ObituaryNERProcessor(BaseNERProcessor):
     def extract_person_info(self, text: str) -> PersonInfo:
         """Extract person information from obituary text."""
         # Normalize whitespace
-        text = ' '.join(text.split())
+        text = _WS_RE.sub(' ', text).strip()
         
         # Process text with spaCy
-        doc = self.nlp(text)
-        
+        return self._person_info_from_doc(text, self.nlp(text))
+
+    def extract_person_info_batch(self, texts: List[str], batch_size: int = 32) -> List[PersonInfo]:
+        """Extract person information from several obituary texts.
+
+        The texts are parsed with a single ``nlp.pipe`` call, which is cheaper
+        than calling :meth:`extract_person_info` once per text.
+        """
+        texts = [_WS_RE.sub(' ', text).strip() for text in texts]
+        docs = self.nlp.pipe(texts, batch_size=batch_size)
+        return [self._person_info_from_doc(text, doc) for text, doc in zip(texts, docs)]
+
+    def _person_info_from_doc(self, text: str, doc) -> PersonInfo:
+        """Build person information from normalized text and its spaCy doc."""
         # Extract basic information
-        full_name, maiden_name, gender = self._extract_name_and_gender(text)
+        full_name, maiden_name, gender = self._extract_name_and_gender(text, doc)
         age = self._extract_age(text)
         birth_date, death_date = self._extract_dates(doc)
         
         # Calculate birth year if we have death date and age but no birth date
         if not birth_date and death_date and age:
             try:
-                death_year = int(death_date.split()[-1])
+                death_year = int(death_date.rsplit(None, 1)[-1])
                 birth_year = death_year - age
                 birth_date = f"01 Jan {birth_year}"
             except (ValueError, IndexError):
@@ -281,14 +433,16 @@ class ObituaryNERProcessor(BaseNERProcessor):
         
         # Extract organizations, education, and military service
         organizations = []
+        seen_organizations = set()
         education = []
         military_service = []
-        
+
+        # Lowercase each sentence once; both keyword scans below reuse it
+        sentences = [(sent, sent.text.lower()) for sent in doc.sents]
+
         # Look for education institutions
-        education_terms = ['university', 'college', 'school', 'institute', 'academy']
-        for sent in doc.sents:
-            sent_text = sent.text.lower()
-            if any(term in sent_text for term in education_terms):
+        for sent, sent_text in sentences:
+            if _EDUCATION_TERMS_RE.search(sent_text):
                 # Extract the institution name
                 for ent in sent.ents:
                     if ent.label_ in ['ORG', 'GPE']:
@@ -296,12 +450,11 @@ class ObituaryNERProcessor(BaseNERProcessor):
                         if org_name:
                             education.append(org_name)
                             organizations.append(org_name)
+                            seen_organizations.add(org_name)
         
         # Look for military service
-        military_terms = ['army', 'navy', 'air force', 'marines', 'coast guard', 'military']
-        for sent in doc.sents:
-            sent_text = sent.text.lower()
-            if any(term in sent_text for term in military_terms):
+        for sent, sent_text in sentences:
+            if _MILITARY_TERMS_RE.search(sent_text):
                 # Extract the military branch
                 for ent in sent.ents:
                     if ent.label_ in ['ORG', 'GPE']:
@@ -310,12 +463,13 @@ class ObituaryNERProcessor(BaseNERProcessor):
                             military_service.append(branch)
         
         # Look for other organizations
-        for sent in doc.sents:
+        for sent, _ in sentences:
             for ent in sent.ents:
                 if ent.label_ == 'ORG':
                     org_name = ent.text.strip()
-                    if org_name and org_name not in organizations:
+                    if org_name and org_name not in seen_organizations:
                         organizations.append(org_name)
+                        seen_organizations.add(org_name)
         
         # Normalize organization names
         organizations = [self._normalize_org_name(org) for org in organizations]
@@ -341,9 +495,11 @@ class ObituaryNERProcessor(BaseNERProcessor):
         """Normalize organization name by removing common prefixes and suffixes."""
         # Remove common prefixes
         prefixes = ['the', 'a', 'an']
+        name_lower = name.lower()
         for prefix in prefixes:
-            if name.lower().startswith(f"{prefix} "):
+            if name_lower.startswith(f"{prefix} "):
                 name = name[len(prefix) + 1:]
+                name_lower = name_lower[len(prefix) + 1:]
         
         # Remove trailing punctuation
         name = name.rstrip('.,;:')
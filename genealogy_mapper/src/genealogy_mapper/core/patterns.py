@@ -103,4 +103,10 @@ SERVICE_PATTERNS = [
 ADDRESS_DATE_PATTERNS = [
     r'\d+\s+[A-Za-z\s]+' + r'\d{4}',  # "123 Main Street 2020"
     r'\d{4}' + r'\s+[A-Za-z\s]+',     # "2020 Main Street"
-] 
\ No newline at end of file
+] 
+
+# Education keywords (lowercase substrings)
+EDUCATION_TERMS = ['university', 'college', 'school', 'institute', 'academy']
+
+# Military service keywords (lowercase substrings)
+MILITARY_TERMS = ['army', 'navy', 'air force', 'marines', 'coast guard', 'military']
@@ -1,5 +1,7 @@
 import json
 import logging
+import sys
+from collections import defaultdict
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from neo4j import GraphDatabase
@@ -7,6 +9,40 @@ from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Relationship labels from the analysis mapped to Neo4j relationship types
+RELATIONSHIP_TYPES = {
+    'SPOUSE': 'SPOUSE_OF',
+    'PARENT': 'PARENT_OF',
+    'CHILD': 'CHILD_OF',
+    'SIBLING': 'SIBLING_OF',
+}
+
+# Relationship types that are created in both directions
+BIDIRECTIONAL_RELATIONSHIP_TYPES = frozenset({'SPOUSE_OF', 'SIBLING_OF'})
+
+def _build_relationship_query(rel_type: str) -> str:
+    """Build the Cypher query that merges a relationship of the given type."""
+    if rel_type in BIDIRECTIONAL_RELATIONSHIP_TYPES:
+        return f"""
+        MATCH (from:Individual {{id: $from_id}})
+        MATCH (to:Individual {{id: $to_id}})
+        MERGE (from)-[r1:{rel_type}]->(to)
+        MERGE (to)-[r2:{rel_type}]->(from)
+        RETURN r1, r2
+        """
+    return f"""
+        MATCH (from:Individual {{id: $from_id}})
+        MATCH (to:Individual {{id: $to_id}})
+        MERGE (from)-[r:{rel_type}]->(to)
+        RETURN r
+        """
+
+# Merge queries for the known relationship types, built once at import
+_RELATIONSHIP_QUERIES = {
+    rel_type: _build_relationship_query(rel_type)
+    for rel_type in RELATIONSHIP_TYPES.values()
+}
+
 class RelationshipProcessor:
     """Process and import relationships into Neo4j."""
     
@@ -77,7 +113,9 @@ class RelationshipProcessor:
                     
                     # Extract name and status
                     name_parts = name_line.split(' - ')
-                    name = name_parts[0].split('. ')[1]  # Remove number and dot
+                    # Names and labels recur across sections and relationship
+                    # entries, so intern them to share one string object each
+                    name = sys.intern(name_parts[0].split('. ')[1])  # Remove number and dot
                     status = name_parts[1] if len(name_parts) > 1 else None
                     
                     # Create GEDCOM-style ID
@@ -86,12 +124,12 @@ class RelationshipProcessor:
                     
                     # Check if we already have this name
                     if name in person_map:
-                        logger.warning(f"Duplicate name found: {name}. Using existing ID: {person_map[name]}")
+                        logger.warning("Duplicate name found: %s. Using existing ID: %s", name, person_map[name])
                         person_id = person_map[name]
                     else:
                         person_map[name] = person_id
                     
-                    logger.info(f"\nProcessing person: {name} (ID: {person_id})")
+                    logger.info("\nProcessing person: %s (ID: %s)", name, person_id)
                     
                     # Initialize person data
                     person_data = {
@@ -127,14 +165,18 @@ class RelationshipProcessor:
             
             logger.info("\nPerson map:")
             for name, id in person_map.items():
-                logger.info(f"{name} -> {id}")
+                logger.info("%s -> %s", name, id)
+            
+            # (type, target ID) pairs recorded per person ID, so a target listed
+            # twice or a repeated person section only adds the relationship once
+            seen_relationships = defaultdict(set)
             
             # Second pass: Process relationships now that all IDs are assigned
             for person in persons:
                 lines = person['raw_section'].split('\n')
                 in_relationships = False
                 
-                logger.info(f"\nProcessing relationships for {person['name']} ({person['id']}):")
+                logger.info("\nProcessing relationships for %s (%s):", person['name'], person['id'])
                 
                 for line in lines[1:]:
                     line_stripped = line.lstrip()
@@ -151,23 +193,31 @@ class RelationshipProcessor:
                         rel_parts = line_stripped.split(': ')
                         if len(rel_parts) == 2:
                             rel_type, target_names = rel_parts
+                            # The label is the same for every target on this line
+                            rel_type = sys.intern(rel_type.replace('- ', '').strip())
+                            person_seen = seen_relationships[person['id']]
                             # Handle multiple targets (e.g., "Sibling: Reginald Paradowski, Joseph Paradowski")
                             for target_name in target_names.split(', '):
-                                if target_name in person_map:
+                                target_id = person_map.get(target_name)
+                                if target_id is not None:
+                                    rel_key = (rel_type, target_id)
+                                    if rel_key in person_seen:
+                                        continue
+                                    person_seen.add(rel_key)
                                     person['relationships'].append({
-                                        "type": rel_type.replace('- ', '').strip(),
-                                        "target_id": person_map[target_name]
+                                        "type": rel_type,
+                                        "target_id": target_id
                                     })
-                                    logger.info(f"Added relationship: {rel_type.replace('- ', '').strip()} -> {target_name} ({person_map[target_name]})")
+                                    logger.info("Added relationship: %s -> %s (%s)", rel_type, target_name, target_id)
                                 else:
-                                    logger.error(f"Target name not found in person_map: {target_name}")
+                                    logger.error("Target name not found in person_map: %s", target_name)
                     elif in_relationships and not line_stripped.startswith('- '):
                         in_relationships = False
                 
                 # Remove raw section as it's no longer needed
                 del person['raw_section']
                 
-                logger.info(f"Total relationships for {person['name']}: {len(person['relationships'])}")
+                logger.info("Total relationships for %s: %s", person['name'], len(person['relationships']))
             
             return {
                 'persons': persons,
@@ -175,13 +225,17 @@ class RelationshipProcessor:
             }
             
         except Exception as e:
-            logger.error(f"Error processing analysis: {str(e)}")
+            logger.error("Error processing analysis: %s", e)
             return None
     
     def import_relationships(self, analysis_data: Dict[str, Any]) -> bool:
         """Import relationships into Neo4j using the structured format."""
         try:
             with self.driver.session() as session:
+                # IDs merged in this import; relationship targets among them
+                # need no round trip to confirm they exist
+                imported_ids = set()
+                
                 # First, create all person nodes
                 for person in analysis_data.get('persons', []):
                     # Create person node with GEDCOM ID
@@ -201,80 +255,76 @@ class RelationshipProcessor:
                         properties=properties
                     )
                     node = result.single()['i']
-                    logger.info(f"Created/updated person node: {person['name']} ({person['id']}) with Neo4j ID: {node.id}")
+                    imported_ids.add(person['id'])
+                    logger.info("Created/updated person node: %s (%s) with Neo4j ID: %s", person['name'], person['id'], node.id)
+                
+                # Symmetric relationships already merged in both directions,
+                # keyed by type and unordered pair of IDs
+                merged_pairs = set()
                 
                 # Then create all relationships
                 for person in analysis_data.get('persons', []):
-                    logger.info(f"\nProcessing relationships for {person['name']} ({person['id']})")
+                    logger.info("\nProcessing relationships for %s (%s)", person['name'], person['id'])
                     relationships = person.get('relationships', [])
-                    logger.info(f"Found {len(relationships)} relationships to process")
+                    logger.info("Found %s relationships to process", len(relationships))
                     
                     for rel in relationships:
                         # Map relationship types to Neo4j relationship types
                         rel_type = rel['type'].upper()
-                        if rel_type == 'SPOUSE':
-                            rel_type = 'SPOUSE_OF'
-                        elif rel_type == 'PARENT':
-                            rel_type = 'PARENT_OF'
-                        elif rel_type == 'CHILD':
-                            rel_type = 'CHILD_OF'
-                        elif rel_type == 'SIBLING':
-                            rel_type = 'SIBLING_OF'
+                        rel_type = RELATIONSHIP_TYPES.get(rel_type, rel_type)
                         
-                        logger.info(f"Creating relationship: {person['name']} -[{rel_type}]-> {rel['target_id']}")
+                        logger.info("Creating relationship: %s -[%s]-> %s", person['name'], rel_type, rel['target_id'])
                         
                         # Verify target node exists
-                        verify_query = """
-                        MATCH (i:Individual {id: $id})
-                        RETURN i
-                        """
-                        result = session.run(verify_query, id=rel['target_id'])
-                        target_node = result.single()
+                        if rel['target_id'] not in imported_ids:
+                            verify_query = """
+                            MATCH (i:Individual {id: $id})
+                            RETURN i
+                            """
+                            result = session.run(verify_query, id=rel['target_id'])
+                            target_node = result.single()
+                            
+                            if not target_node:
+                                logger.error("Target node not found: %s", rel['target_id'])
+                                continue
                         
-                        if not target_node:
-                            logger.error(f"Target node not found: {rel['target_id']}")
-                            continue
+                        # Both sides of a spouse/sibling pair usually list each other
+                        if rel_type in BIDIRECTIONAL_RELATIONSHIP_TYPES:
+                            pair_key = (rel_type, frozenset((person['id'], rel['target_id'])))
+                            if pair_key in merged_pairs:
+                                logger.debug("Skipping already merged relationship: %s -[%s]-> %s", person['name'], rel_type, rel['target_id'])
+                                continue
+                            merged_pairs.add(pair_key)
+                        
+                        query = _RELATIONSHIP_QUERIES.get(rel_type) or _build_relationship_query(rel_type)
                         
                         # Create bidirectional relationships for certain types
-                        if rel_type in ['SPOUSE_OF', 'SIBLING_OF']:
+                        if rel_type in BIDIRECTIONAL_RELATIONSHIP_TYPES:
                             # Create relationship in both directions
-                            query = f"""
-                            MATCH (from:Individual {{id: $from_id}})
-                            MATCH (to:Individual {{id: $to_id}})
-                            MERGE (from)-[r1:{rel_type}]->(to)
-                            MERGE (to)-[r2:{rel_type}]->(from)
-                            RETURN r1, r2
-                            """
                             result = session.run(query, 
                                 from_id=person['id'],
                                 to_id=rel['target_id']
                             )
                             rels = result.single()
                             if rels and (rels['r1'] or rels['r2']):
-                                logger.info(f"Created bidirectional relationship: {rel_type}")
+                                logger.info("Created bidirectional relationship: %s", rel_type)
                             else:
-                                logger.error(f"Failed to create bidirectional relationship: {rel_type}")
+                                logger.error("Failed to create bidirectional relationship: %s", rel_type)
                         else:
                             # Create relationship in one direction
-                            query = f"""
-                            MATCH (from:Individual {{id: $from_id}})
-                            MATCH (to:Individual {{id: $to_id}})
-                            MERGE (from)-[r:{rel_type}]->(to)
-                            RETURN r
-                            """
                             result = session.run(query, 
                                 from_id=person['id'],
                                 to_id=rel['target_id']
                             )
                             rel_obj = result.single()['r']
                             if rel_obj:
-                                logger.info(f"Created relationship: {rel_type}")
+                                logger.info("Created relationship: %s", rel_type)
                             else:
-                                logger.error(f"Failed to create relationship: {rel_type}")
+                                logger.error("Failed to create relationship: %s", rel_type)
                 
                 return True
         except Exception as e:
-            logger.error(f"Error importing relationships: {str(e)}")
+            logger.error("Error importing relationships: %s", e)
             return False
     
     def get_relationship_graph(self) -> Dict[str, Any]:
@@ -293,6 +343,7 @@ class RelationshipProcessor:
                 nodes = []
                 edges = []
                 seen_nodes = set()
+                seen_edges = set()
                 
                 for record in result:
                     person = record['i']
@@ -315,7 +366,9 @@ class RelationshipProcessor:
                             'properties': dict(record['r'])
                         }
                         # Only add if we haven't seen this edge before
-                        if not any(e['from'] == edge['from'] and e['to'] == edge['to'] and e['label'] == edge['label'] for e in edges):
+                        edge_key = (edge['from'], edge['to'], edge['label'])
+                        if edge_key not in seen_edges:
+                            seen_edges.add(edge_key)
                             edges.append(edge)
                 
                 return {
@@ -323,7 +376,7 @@ class RelationshipProcessor:
                     'edges': edges
                 }
         except Exception as e:
-            logger.error(f"Error getting relationship graph: {str(e)}")
+            logger.error("Error getting relationship graph: %s", e)
             return None
     
     def debug_check_relationships(self) -> None:
@@ -341,7 +394,7 @@ class RelationshipProcessor:
                 found_relationships = False
                 for record in result:
                     found_relationships = True
-                    logger.info(f"Found relationship: {record['from_name']} -[{record['rel_type']}]-> {record['to_name']}")
+                    logger.info("Found relationship: %s -[%s]-> %s", record['from_name'], record['rel_type'], record['to_name'])
                 
                 if not found_relationships:
                     logger.info("No relationships found in the database.")
@@ -353,8 +406,8 @@ class RelationshipProcessor:
                 """
                 result = session.run(query)
                 count = result.single()['node_count']
-                logger.info(f"\nTotal Individual nodes in database: {count}")
+                logger.info("\nTotal Individual nodes in database: %s", count)
                 
         except Exception as e:
-            logger.error(f"Error checking relationships: {str(e)}")
+            logger.error("Error checking relationships: %s", e)
             return None 
\ No newline at end of file
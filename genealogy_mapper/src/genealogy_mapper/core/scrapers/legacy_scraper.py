@@ -1,5 +1,6 @@
 import json
 import logging
+import re
 import time
 from typing import Optional, Dict, Any
 from bs4 import BeautifulSoup
@@ -11,6 +12,8 @@ from .base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r'\s+')
+
 class LegacyScraper(BaseScraper):
     """Scraper for Legacy.com obituaries."""
     
@@ -138,31 +141,21 @@ class LegacyScraper(BaseScraper):
             for selector in selectors:
                 text_div = soup.select_one(selector)
                 if text_div:
-                    # Get all text elements within the container
-                    text_elements = []
-                    for element in text_div.stripped_strings:
-                        text_elements.append(element)
-                    
-                    # Join all text elements with proper spacing
-                    text = ' '.join(text_elements)
+                    # Join all text elements within the container with proper spacing
+                    text = ' '.join(text_div.stripped_strings)
                     if text:
                         # Clean up the text
-                        text = ' '.join(text.split())  # Normalize whitespace
+                        text = _WS_RE.sub(' ', text)  # Normalize whitespace
                         return text
             
             # If no specific selector worked, try to find the main content area
             main_content = soup.find('main') or soup.find('article')
             if main_content:
-                # Get all text elements within the main content
-                text_elements = []
-                for element in main_content.stripped_strings:
-                    text_elements.append(element)
-                
-                # Join all text elements with proper spacing
-                text = ' '.join(text_elements)
+                # Join all text elements within the main content with proper spacing
+                text = ' '.join(main_content.stripped_strings)
                 if text:
                     # Clean up the text
-                    text = ' '.join(text.split())  # Normalize whitespace
+                    text = _WS_RE.sub(' ', text)  # Normalize whitespace
                     return text
             
             # If still no text found, try to find any text that looks like an obituary
@@ -212,7 +205,7 @@ class LegacyScraper(BaseScraper):
                     if "name" in data:
                         metadata["name"] = data["name"]
                     elif "headline" in data:
-                        metadata["name"] = data["headline"].split(" Obituary")[0]
+                        metadata["name"] = data["headline"].partition(" Obituary")[0]
                     
                     # Extract location
                     if "deathPlace" in data and "address" in data["deathPlace"]:
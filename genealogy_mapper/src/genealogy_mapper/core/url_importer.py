@@ -1,14 +1,36 @@
 import json
 import logging
 import os
-from typing import Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable
 import requests
 import validators
 from datetime import datetime
 from .scrapers.factory import ScraperFactory
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+def _read_json_file(path: str) -> Any:
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json_file(path: str, data: Any) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 def get_project_root() -> str:
     """Get the project root directory."""
     # Start from the current file's directory and go up until we find the project root
@@ -46,34 +68,37 @@ class URLImporter:
                 "urls": [],
                 "last_updated": datetime.now().isoformat()
             }
-            with open(self.json_path, 'w') as f:
-                json.dump(default_data, f, indent=2)
+            _write_json_file(self.json_path, default_data)
         else:
             # Validate and fix existing file structure
             try:
-                with open(self.json_path, 'r') as f:
-                    data = json.load(f)
+                data = _read_json_file(self.json_path)
+                changed = False
                 
                 # Ensure required fields exist
                 if 'urls' not in data:
                     data['urls'] = []
+                    changed = True
                 if 'last_updated' not in data:
                     data['last_updated'] = datetime.now().isoformat()
+                    changed = True
                 
                 # Update each URL entry to include new fields
                 for url_entry in data['urls']:
                     if 'status' not in url_entry:
                         url_entry['status'] = 'pending'
+                        changed = True
                     if 'relationships_extracted' not in url_entry:
                         url_entry['relationships_extracted'] = {
                             'status': 'pending',  # pending, completed, failed
                             'last_attempt': None,
                             'error': None
                         }
+                        changed = True
                 
-                # Write back the updated structure
-                with open(self.json_path, 'w') as f:
-                    json.dump(data, f, indent=2)
+                # Write back the updated structure only if it was migrated
+                if changed:
+                    _write_json_file(self.json_path, data)
                     
             except json.JSONDecodeError:
                 logger.warning(f"Could not read {self.json_path}, creating new file")
@@ -87,13 +112,12 @@ class URLImporter:
     def _load_json(self) -> Dict:
         """Load and validate JSON data."""
         try:
-            with open(self.json_path, 'r') as f:
-                data = json.load(f)
-                if not isinstance(data, dict):
-                    raise ValueError("Invalid JSON structure")
-                if "urls" not in data:
-                    data["urls"] = []
-                return data
+            data = _read_json_file(self.json_path)
+            if not isinstance(data, dict):
+                raise ValueError("Invalid JSON structure")
+            if "urls" not in data:
+                data["urls"] = []
+            return data
         except (json.JSONDecodeError, FileNotFoundError):
             logger.warning(f"Could not read {self.json_path}, creating new file")
             return {"urls": [], "last_updated": datetime.now().isoformat()}
@@ -101,8 +125,7 @@ class URLImporter:
     def _save_json(self, data: Dict) -> None:
         """Save data to JSON file."""
         data["last_updated"] = datetime.now().isoformat()
-        with open(self.json_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json_file(self.json_path, data)
     
     def validate_url(self, url: str) -> bool:
         """
@@ -180,8 +203,7 @@ class URLImporter:
             List[Dict]: List of URLs that need processing
         """
         try:
-            with open(self.json_path, 'r') as f:
-                data = json.load(f)
+            data = _read_json_file(self.json_path)
                 
             if self.force_rescrape:
                 # Return all URLs if force_rescrape is True
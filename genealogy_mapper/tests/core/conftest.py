@@ -3,6 +3,16 @@ import pytest
 import tempfile
 import yaml
 
+@pytest.fixture(scope="session")
+def ner_processor():
+    """Create an ObituaryNERProcessor shared by the whole test session.
+    
+    Loading the spaCy pipeline dominates NER test setup, so it is done once.
+    Imported here so tests that don't use it never load spaCy.
+    """
+    from genealogy_mapper.core.ner_processor import ObituaryNERProcessor
+    return ObituaryNERProcessor()
+
 @pytest.fixture
 def temp_config_file():
     """Create a temporary config file with Neo4j connection details."""
@@ -1,6 +1,5 @@
 import pytest
 from unittest.mock import patch, MagicMock
-from genealogy_mapper.core.config import Config
 from genealogy_mapper.core.db_init import init_db
 
 @pytest.fixture
@@ -17,5 +16,10 @@ def test_database_initialization(mock_driver, temp_config_file, mock_neo4j_drive
     mock_driver.return_value = mock_neo4j_driver[0]
     mock_neo4j_driver[1].run.return_value.single.return_value = {"n": 1}
     
-    config = Config(config_path=temp_config_file)
-    assert init_db(config_path=temp_config_file) is True, "Database initialization failed" 
\ No newline at end of file
+    assert init_db(config_path=temp_config_file) is True, "Database initialization failed"
+    
+    # The schema and the metadata node were written through the session
+    queries = [call[0][0] for call in mock_neo4j_driver[1].run.call_args_list]
+    assert any(query.startswith("CREATE CONSTRAINT") for query in queries)
+    assert any(query.startswith("CREATE INDEX") for query in queries)
+    assert queries[-1] == "CREATE (m:Metadata $metadata)" 
\ No newline at end of file